@@ -6,6 +6,8 @@ Searches by configurable fields (hostname, serial, role, etc.) with OR logic.
 """
 
 import logging
+import operator
+from types import MappingProxyType
 
 from netbox.plugins import PluginConfig
 
@@ -13,6 +15,29 @@ __version__ = "0.5.8"
 
 logger = logging.getLogger(__name__)
 
+# Default search field definitions. Read-only so the shared defaults can be
+# handed to every request (and reused as fallbacks in views) without copying.
+DEFAULT_SEARCH_FIELDS = tuple(
+    MappingProxyType(field)
+    for field in (
+        {"name": "Hostname", "attribute": "name", "enabled": True},
+        {"name": "Serial", "attribute": "serial", "enabled": True},
+        {"name": "Asset Tag", "attribute": "asset_tag", "enabled": False},
+        {"name": "Role", "attribute": "role.name", "enabled": False},
+        {"name": "Primary IP", "attribute": "primary_ip4.address", "enabled": False},
+    )
+)
+
+DEFAULT_ENDPOINT_SEARCH_FIELDS = tuple(
+    MappingProxyType(field)
+    for field in (
+        {"name": "Name", "attribute": "name", "enabled": True},
+        {"name": "MAC Address", "attribute": "mac_address", "enabled": True},
+        {"name": "Serial", "attribute": "serial", "enabled": True},
+        {"name": "Asset Tag", "attribute": "asset_tag", "enabled": False},
+    )
+)
+
 
 class AtlassianConfig(PluginConfig):
     """Plugin configuration for NetBox Atlassian integration."""
@@ -51,21 +76,10 @@ class AtlassianConfig(PluginConfig):
         # Search configuration
         # Fields to search - values are device attribute paths
         # Searches use OR logic - matches any field
-        "search_fields": [
-            {"name": "Hostname", "attribute": "name", "enabled": True},
-            {"name": "Serial", "attribute": "serial", "enabled": True},
-            {"name": "Asset Tag", "attribute": "asset_tag", "enabled": False},
-            {"name": "Role", "attribute": "role.name", "enabled": False},
-            {"name": "Primary IP", "attribute": "primary_ip4.address", "enabled": False},
-        ],
+        "search_fields": DEFAULT_SEARCH_FIELDS,
         # Endpoint search fields (for netbox-endpoints plugin)
         # Searches use OR logic - matches any field
-        "endpoint_search_fields": [
-            {"name": "Name", "attribute": "name", "enabled": True},
-            {"name": "MAC Address", "attribute": "mac_address", "enabled": True},
-            {"name": "Serial", "attribute": "serial", "enabled": True},
-            {"name": "Asset Tag", "attribute": "asset_tag", "enabled": False},
-        ],
+        "endpoint_search_fields": DEFAULT_ENDPOINT_SEARCH_FIELDS,
         # Jira search settings
         "jira_max_results": 10,
         "jira_projects": [],  # Empty = search all projects
@@ -125,11 +139,29 @@ class AtlassianConfig(PluginConfig):
         "contact_lookup_variables": ["project_manager"],
     }
 
+    # Enabled device search fields as configured, and their
+    # (field name, attribute path, attrgetter) triples, built in ready()
+    enabled_search_fields = ()
+    compiled_search_fields = ()
+
     def ready(self):
-        """Register endpoint view if netbox_endpoints is available."""
+        """Compile search fields and register endpoint view if netbox_endpoints is available."""
         super().ready()
+        self._compile_search_fields()
         self._register_endpoint_views()
 
+    def _compile_search_fields(self):
+        """Collect enabled device search fields and precompile their attribute paths into attrgetters."""
+        from django.conf import settings
+
+        search_fields = settings.PLUGINS_CONFIG.get("netbox_atlassian", {}).get("search_fields", DEFAULT_SEARCH_FIELDS)
+        self.enabled_search_fields = tuple(field for field in search_fields if field.get("enabled", True))
+        self.compiled_search_fields = tuple(
+            (field.get("name", field["attribute"]), field["attribute"], operator.attrgetter(field["attribute"]))
+            for field in self.enabled_search_fields
+            if field.get("attribute")
+        )
+
     def _register_endpoint_views(self):
         """Register Atlassian tab for Endpoints if plugin is installed."""
         import sys
@@ -147,12 +179,16 @@ class AtlassianConfig(PluginConfig):
                 return
 
         try:
-            from django.shortcuts import render
+            from django.shortcuts import get_object_or_404, render
             from netbox.views import generic
             from netbox_endpoints.models import Endpoint
             from utilities.views import ViewTab, register_model_view
 
-            from .views import should_show_atlassian_tab_endpoint
+            def should_show_atlassian_tab_endpoint(endpoint):
+                # Import views on first tab render rather than at startup
+                from .views import should_show_atlassian_tab_endpoint as visible
+
+                return visible(endpoint)
 
             @register_model_view(Endpoint, name="atlassian", path="atlassian")
             class EndpointAtlassianView(generic.ObjectView):
@@ -170,7 +206,7 @@ class AtlassianConfig(PluginConfig):
                 )
 
                 def get(self, request, pk):
-                    endpoint = Endpoint.objects.get(pk=pk)
+                    endpoint = get_object_or_404(self.queryset, pk=pk)
                     return render(
                         request,
                         self.template_name,
@@ -4,19 +4,215 @@ Atlassian API Client for Jira and Confluence
 Supports both on-premise and cloud deployments.
 """
 
+import functools
+import hashlib
 import logging
+import math
+import random
 import re
 import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Optional
 
 import requests
 from django.conf import settings
 from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib3.util.ssl_ import create_urllib3_context
 
+from . import __version__
+
+# Optional speedups, see the "speedups" extra
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
+# Shared pool for running the Jira and Confluence searches concurrently.
+# Threads are started lazily on first submit, so forked workers each get their own.
+_search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="netbox-atlassian")
+
+# Separate, smaller pool for skeleton-view prefetches so they never queue ahead of
+# search_all() work. One slot per worker: prefetches are dropped, not queued, when it is busy.
+PREFETCH_MAX_WORKERS = 4
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=PREFETCH_MAX_WORKERS, thread_name_prefix="netbox-atlassian-prefetch"
+)
+_prefetch_slots = threading.BoundedSemaphore(PREFETCH_MAX_WORKERS)
+# Marks prefetch threads, so the entries they cache are tagged and the page's own
+# content request doesn't report just-fetched results as "from cache"
+_prefetch_state = threading.local()
+
+# Escapes quotes and backslashes inside JQL/CQL string literals
+QUERY_ESCAPE = str.maketrans({'"': '\\"', "\\": "\\\\"})
+
+# Jira fields rendered in the tab; labels are only requested for tag searches
+JIRA_SEARCH_FIELDS = "summary,status,issuetype,priority,assignee,created,updated,project"
+JIRA_SEARCH_FIELDS_WITH_LABELS = f"{JIRA_SEARCH_FIELDS},labels"
+
+# Confluence expansions rendered in the tab; labels are only expanded for tag searches
+CONFLUENCE_SEARCH_EXPAND = "space,version,ancestors"
+CONFLUENCE_SEARCH_EXPAND_WITH_LABELS = f"{CONFLUENCE_SEARCH_EXPAND},metadata.labels"
+
+# Connection pool size per host, sized for concurrent tab loads sharing one client
+POOL_MAXSIZE = 32
+
+# Adapter-level retries for failed connects and 502/503/504 responses. Read timeouts
+# are never retried, so one API call takes at most (1 + REQUEST_RETRIES) timeouts.
+REQUEST_RETRIES = 1
+
+_client = None
+_client_lock = threading.Lock()
+
+# Process-local TTL cache in front of Django's cache (the shared L2)
+LOCAL_CACHE_MAXSIZE = 256
+_local_cache = {}  # cache_key -> (expires_at, response)
+_local_cache_lock = threading.Lock()
+
+# Striped per-key locks so concurrent misses for one query only hit the API once
+_key_locks = [threading.Lock() for _ in range(64)]
+
+# Seconds between checks of Django's cache while another process fetches the same query
+SHARED_LOCK_POLL_INTERVAL = 0.1
+
+# Share of the request timeout a cache miss waits on another process's fetch before
+# fetching itself (e.g. when the lock holder was killed mid-request)
+SHARED_LOCK_WAIT_FRACTION = 0.5
+
+
+def _parse_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _cache_key(prefix: str, query: str) -> str:
+    """Build a cache key that is stable across worker processes (unlike hash())."""
+    return f"{prefix}_{hashlib.blake2b(query.encode('utf-8'), digest_size=12).hexdigest()}"
+
+
+def _shared_cache_get(key: str) -> Optional[dict]:
+    """Read a search response from Django's cache, unpacking msgpack payloads."""
+    value = cache.get(key)
+    if isinstance(value, bytes):
+        # Packed by a worker with msgpack installed; treat as a miss if we can't read it
+        return msgpack.unpackb(value, raw=False) if msgpack is not None else None
+    return value
+
+
+def _shared_cache_set(key: str, value: dict, timeout: Optional[int]):
+    """Store a search response in Django's cache, as msgpack bytes when available."""
+    if msgpack is not None:
+        value = msgpack.packb(value, use_bin_type=True)
+    if timeout:
+        # Spread expirations by +/-10% so entries created together don't all expire together
+        timeout *= random.uniform(0.9, 1.1)
+    cache.set(key, value, timeout)
+
+
+def _local_cache_get(key: str) -> Optional[dict]:
+    """Return a live entry from the process-local cache, or None."""
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        with _local_cache_lock:
+            _local_cache.pop(key, None)
+        return None
+    return value
+
+
+def _local_cache_set(key: str, value: dict, timeout: Optional[int]):
+    """
+    Store an entry in the process-local cache, evicting the oldest when full.
+
+    Follows Django's timeout semantics: None never expires, 0 is not cached.
+    """
+    if timeout == 0:
+        return
+    expires_at = math.inf if timeout is None else time.monotonic() + timeout
+    with _local_cache_lock:
+        _local_cache.pop(key, None)
+        _local_cache[key] = (expires_at, value)
+        while len(_local_cache) > LOCAL_CACHE_MAXSIZE:
+            _local_cache.pop(next(iter(_local_cache)))
+
+
+def _run_prefetch(fn, *args, **kwargs):
+    """Call fn with this thread marked as prefetching."""
+    _prefetch_state.active = True
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _prefetch_state.active = False
+
+
+def _submit_prefetch(fn, *args, **kwargs) -> bool:
+    """Run fn on the prefetch pool if a worker is free, otherwise drop it. Returns whether it was submitted."""
+    if not _prefetch_slots.acquire(blocking=False):
+        return False
+    try:
+        future = _prefetch_executor.submit(_run_prefetch, fn, *args, **kwargs)
+    except RuntimeError:
+        # Interpreter shutting down
+        _prefetch_slots.release()
+        return False
+    future.add_done_callback(lambda _future: _prefetch_slots.release())
+    return True
+
+
+def _wait_for_shared_fetch(cache_key: str, lock_key: str, timeout: float) -> Optional[dict]:
+    """
+    Wait for another process holding lock_key to cache its result for cache_key.
+
+    Returns the cached response, or None if the lock is released without a
+    result (e.g. the fetch failed) or timeout elapses.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(SHARED_LOCK_POLL_INTERVAL)
+        cached = _shared_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        if cache.get(lock_key) is None:
+            return None
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _exact_term_pattern(term_lower: str) -> re.Pattern:
+    """Compile the whole-word match pattern for a lowercased search term."""
+    # Match whole word only (word boundaries or start/end of string)
+    return re.compile(rf"(?:^|[\s\-_,;:\.\/\(\)\[\]]){re.escape(term_lower)}(?:$|[\s\-_,;:\.\/\(\)\[\]])")
+
+
+@functools.lru_cache(maxsize=1)
+def _legacy_ssl_context():
+    """
+    Build the shared SSL context used by LegacySSLAdapter.
+
+    Created once per process so every pool reuses it (and its TLS session cache).
+    """
+    ctx = create_urllib3_context()
+    # Enable legacy renegotiation for older servers
+    ctx.options |= ssl.OP_LEGACY_SERVER_CONNECT
+    return ctx
+
 
 class LegacySSLAdapter(HTTPAdapter):
     """
@@ -27,10 +223,7 @@ class LegacySSLAdapter(HTTPAdapter):
     """
 
     def init_poolmanager(self, *args, **kwargs):
-        ctx = create_urllib3_context()
-        # Enable legacy renegotiation for older servers
-        ctx.options |= ssl.OP_LEGACY_SERVER_CONNECT
-        kwargs["ssl_context"] = ctx
+        kwargs["ssl_context"] = _legacy_ssl_context()
         return super().init_poolmanager(*args, **kwargs)
 
 
@@ -60,9 +253,23 @@ class AtlassianClient:
         self.cloud_api_token = self.config.get("cloud_api_token", "")
         self.cloud_email = self.config.get("cloud_email", "")
 
+        # Result limits, also used as upper bounds for callers passing max_results
+        self.jira_max_results = int(self.config.get("jira_max_results", 10))
+        self.confluence_max_results = int(self.config.get("confluence_max_results", 10))
+
         # General settings
         self.timeout = self.config.get("timeout", 30)
         self.cache_timeout = self.config.get("cache_timeout", 300)
+        # Worst-case duration of one search API call, including adapter retries
+        self.request_deadline = self.timeout * (1 + REQUEST_RETRIES)
+        # How long a search may wait on another process's in-flight fetch, and the overall
+        # search deadline, which leaves room for that wait followed by our own fetch
+        self.shared_wait_timeout = self.timeout * SHARED_LOCK_WAIT_FRACTION
+        self.search_deadline = self.shared_wait_timeout + self.request_deadline
+
+        # Query filters appended to every search (plugin config is fixed for the process)
+        self._jira_jql_suffix = self._build_jira_jql_suffix()
+        self._confluence_cql_suffix = self._build_confluence_cql_suffix()
 
         # Legacy SSL support (for servers requiring legacy renegotiation)
         self.enable_legacy_ssl = self.config.get("enable_legacy_ssl", False)
@@ -70,15 +277,105 @@ class AtlassianClient:
         # Create session with legacy SSL if needed
         self._session = None
 
+        # Prepared connection-test requests, built with the session
+        self._prepared_myself = None
+        self._prepared_user_current = None
+
+    def _build_jira_jql_suffix(self) -> str:
+        """Build the project/issue type filters and ordering appended to every JQL search."""
+        suffix = ""
+
+        # Add project filter if configured
+        projects = self.config.get("jira_projects", [])
+        if projects:
+            project_jql = " OR ".join(f'project = "{p}"' for p in projects)
+            suffix += f" AND ({project_jql})"
+
+        # Add issue type filter if configured
+        issue_types = self.config.get("jira_issue_types", [])
+        if issue_types:
+            type_jql = " OR ".join(f'issuetype = "{t}"' for t in issue_types)
+            suffix += f" AND ({type_jql})"
+
+        # Order by updated date descending
+        return f"{suffix} ORDER BY updated DESC"
+
+    def _build_confluence_cql_suffix(self) -> str:
+        """Build the content type and space filters appended to every CQL search."""
+        # Filter to pages only (not attachments, comments, etc.)
+        suffix = " AND type = page"
+
+        # Add space filter if configured
+        spaces = self.config.get("confluence_spaces", [])
+        if spaces:
+            space_cql = " OR ".join(f'space = "{s}"' for s in spaces)
+            suffix += f" AND ({space_cql})"
+
+        return suffix
+
     def _get_session(self) -> requests.Session:
         """Get or create a requests session with optional legacy SSL support."""
         if self._session is None:
-            self._session = requests.Session()
-            if self.enable_legacy_ssl:
-                adapter = LegacySSLAdapter()
-                self._session.mount("https://", adapter)
+            session = requests.Session()
+            # Retry failed connects and transient gateway errors on GETs, reusing the pooled
+            # connection. Read timeouts are not retried (read=0): a hung server would otherwise
+            # hold callers for several full timeouts. Retry-After is ignored for the same reason,
+            # so a 503 can't stall the caller past request_deadline. raise_on_status=False hands
+            # the final response back for normal error handling.
+            retries = Retry(
+                total=REQUEST_RETRIES,
+                connect=REQUEST_RETRIES,
+                read=0,
+                status=REQUEST_RETRIES,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            )
+            adapter_class = LegacySSLAdapter if self.enable_legacy_ssl else HTTPAdapter
+            session.mount("https://", adapter_class(pool_maxsize=POOL_MAXSIZE, max_retries=retries))
+            # requests' defaults already ask for compression and keep-alive; only identify the plugin
+            session.headers["User-Agent"] = f"netbox-atlassian/{__version__}"
+
+            if self.jira_url:
+                self._prepared_myself = self._prepare_probe(
+                    session, f"{self.jira_url}/rest/api/2/myself", self.jira_token, self._get_jira_auth()
+                )
+            if self.confluence_url:
+                self._prepared_user_current = self._prepare_probe(
+                    session,
+                    f"{self.confluence_url}/rest/api/user/current",
+                    self.confluence_token,
+                    self._get_confluence_auth(),
+                )
+            self._session = session
         return self._session
 
+    @staticmethod
+    def _prepare_probe(session: requests.Session, url: str, token: str, auth: tuple) -> requests.PreparedRequest:
+        """Prepare a reusable GET request for a connection test endpoint."""
+        if token:
+            request = requests.Request("GET", url, headers={"Authorization": f"Bearer {token}"})
+        else:
+            request = requests.Request("GET", url, auth=auth)
+        return session.prepare_request(request)
+
+    def _send_probe(self, prepared: requests.PreparedRequest, verify: bool, service: str) -> Optional[dict]:
+        """Send a prepared connection test request and return the decoded JSON."""
+        session = self._get_session()
+        try:
+            # send() skips the proxy/CA environment merge that session.get() does
+            send_kwargs = session.merge_environment_settings(prepared.url, {}, None, verify, None)
+            response = session.send(prepared, timeout=self.timeout, **send_kwargs)
+            if response.status_code >= 400:
+                logger.error(f"{service} API error: HTTP {response.status_code} for {prepared.url}")
+                return None
+            return _parse_json(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"{service} API error: {e}")
+            return None
+
     def _get_jira_auth(self):
         """Get authentication for Jira API."""
         if self.use_cloud:
@@ -118,9 +415,12 @@ class AtlassianClient:
                     verify=self.jira_verify_ssl,
                     timeout=self.timeout,
                 )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            if response.status_code >= 400:
+                logger.error(f"Jira API error: HTTP {response.status_code} for {url}")
+                return None
+            return _parse_json(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # Transport errors (connection, timeout) and malformed bodies
             logger.error(f"Jira API error: {e}")
             return None
 
@@ -152,12 +452,8 @@ class AtlassianClient:
             term_lower = term.lower()
 
             if match_mode == "exact":
-                # Use word boundary matching for exact terms
-                # Escape special regex characters in the term
-                escaped_term = re.escape(term_lower)
-                # Match whole word only (word boundaries or start/end of string)
-                pattern = rf"(?:^|[\s\-_,;:\.\/\(\)\[\]]){escaped_term}(?:$|[\s\-_,;:\.\/\(\)\[\]])"
-                if re.search(pattern, combined_text):
+                # Use word boundary matching for exact terms (compiled once per term)
+                if _exact_term_pattern(term_lower).search(combined_text):
                     field_name = terms_with_fields.get(term, term)
                     if field_name not in matched_fields:
                         matched_fields.append(field_name)
@@ -219,81 +515,134 @@ class AtlassianClient:
                     verify=self.confluence_verify_ssl,
                     timeout=self.timeout,
                 )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            if response.status_code >= 400:
+                logger.error(f"Confluence API error: HTTP {response.status_code} for {url}")
+                return None
+            return _parse_json(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # Transport errors (connection, timeout) and malformed bodies
             logger.error(f"Confluence API error: {e}")
             return None
 
-    def search_jira(self, search_terms: list[str], terms_with_fields: dict[str, str], max_results: int = 10, tag_slugs: list[str] = None) -> dict:
+    def _get_or_fetch(self, cache_key: str, fetch) -> dict:
         """
-        Search Jira for issues containing any of the search terms.
-
-        Args:
-            search_terms: List of terms to search (OR logic)
-            terms_with_fields: Dict mapping term -> field_name (e.g., {"server01": "Hostname"})
-            max_results: Maximum number of results to return
+        Return a cached search response, calling fetch() on a miss.
+
+        Checks the process-local cache first, then Django's cache. Concurrent
+        misses for the same key wait on a per-key lock and re-check, so only
+        one thread per process calls the API; across processes, a cache.add()
+        lock lets one worker fetch while the others wait for its cached result.
+        Error responses are not cached. Entries stored by a prefetch are tagged,
+        and their first non-prefetch read is reported as fresh (cached=False).
+        """
+        cached = _local_cache_get(cache_key)
+        if cached is None:
+            with _key_locks[hash(cache_key) % len(_key_locks)]:
+                cached = _local_cache_get(cache_key)
+                if cached is None:
+                    cached = _shared_cache_get(cache_key)
+                    if cached is None:
+                        lock_key = f"{cache_key}_lock"
+                        owns_lock = cache.add(lock_key, 1, self.request_deadline + 5)
+                        if not owns_lock:
+                            cached = _wait_for_shared_fetch(cache_key, lock_key, self.shared_wait_timeout)
+                    if cached is None:
+                        try:
+                            response = fetch()
+                            if response.get("error") is None:
+                                stored = response
+                                if getattr(_prefetch_state, "active", False):
+                                    stored = {**response, "prefetched": True}
+                                _shared_cache_set(cache_key, stored, self.cache_timeout)
+                                _local_cache_set(cache_key, stored, self.cache_timeout)
+                        finally:
+                            if owns_lock:
+                                cache.delete(lock_key)
+                        return response
+                    _local_cache_set(cache_key, cached, self.cache_timeout)
+        return self._cache_hit(cache_key, cached)
+
+    def _cache_hit(self, cache_key: str, cached: dict) -> dict:
+        """
+        Build the response for a cache hit.
 
-        Returns:
-            dict with 'issues' list and 'total' count
+        The first content read of a prefetched entry clears its tag and is
+        reported as fresh, since it was fetched for this same page load.
         """
-        if not self.jira_url or (not search_terms and not tag_slugs):
-            return {"issues": [], "total": 0, "error": None}
+        if cached.get("prefetched") and not getattr(_prefetch_state, "active", False):
+            fresh = {key: value for key, value in cached.items() if key != "prefetched"}
+            _shared_cache_set(cache_key, fresh, self.cache_timeout)
+            _local_cache_set(cache_key, fresh, self.cache_timeout)
+            return {**fresh, "cached": False}
+        return {**cached, "cached": True}
+
+    def _build_jql(self, terms: list[str], tag_slugs: list[str] = None) -> str:
+        """
+        Build the JQL for a set of (already filtered) search terms and tag slugs.
 
-        # Get search mode from config
+        Terms and slugs are sorted, so the same inputs in any order produce the
+        same query (and therefore share one cache entry).
+        """
         search_mode = self.config.get("jira_search_mode", "strict")
 
         # Build JQL query with OR logic
-        text_queries = []
-        for term in search_terms:
-            if term:
-                # Escape special JQL characters
-                escaped = term.replace('"', '\\"')
-                if search_mode == "title_only":
-                    # Only search in issue summary
-                    text_queries.append(f'summary ~ "{escaped}"')
-                else:
-                    # Search in all content (summary, description, comments)
-                    text_queries.append(f'text ~ "{escaped}"')
+        # title_only searches the issue summary, otherwise all content (summary, description, comments)
+        text_field = "summary" if search_mode == "title_only" else "text"
+        text_queries = [f'{text_field} ~ "{term.translate(QUERY_ESCAPE)}"' for term in sorted(terms)]
 
         # Build label query for tags
         label_queries = []
-        jira_prefix = self.config.get("jira_tag_label_prefix", "")
         if tag_slugs:
-            prefixed = [f"{jira_prefix}{s}" for s in tag_slugs]
+            jira_prefix = self.config.get("jira_tag_label_prefix", "")
+            prefixed = [f"{jira_prefix}{s}" for s in sorted(tag_slugs)]
             label_list = ", ".join([f'"{lbl}"' for lbl in prefixed])
             label_queries.append(f"labels in ({label_list})")
 
-        if not text_queries and not label_queries:
-            return {"issues": [], "total": 0, "error": None}
+        return f"({' OR '.join(text_queries + label_queries)}){self._jira_jql_suffix}"
 
-        jql = " OR ".join(text_queries + label_queries)
+    def search_jira(self, search_terms: list[str], terms_with_fields: dict[str, str], max_results: int = 10, tag_slugs: list[str] = None) -> dict:
+        """
+        Search Jira for issues containing any of the search terms.
 
-        # Add project filter if configured
-        projects = self.config.get("jira_projects", [])
-        if projects:
-            project_jql = " OR ".join([f'project = "{p}"' for p in projects])
-            jql = f"({jql}) AND ({project_jql})"
+        Args:
+            search_terms: List of terms to search (OR logic)
+            terms_with_fields: Dict mapping term -> field_name (e.g., {"server01": "Hostname"})
+            max_results: Maximum number of results to return
 
-        # Add issue type filter if configured
-        issue_types = self.config.get("jira_issue_types", [])
-        if issue_types:
-            type_jql = " OR ".join([f'issuetype = "{t}"' for t in issue_types])
-            jql = f"({jql}) AND ({type_jql})"
+        Returns:
+            dict with 'issues' list and 'total' count
+        """
+        # Drop empty and duplicate terms (e.g. hostname == asset tag), keeping order
+        terms = list(dict.fromkeys(t for t in search_terms if t))
+        if not self.jira_url or (not terms and not tag_slugs):
+            return {"issues": [], "total": 0, "error": None}
 
-        # Order by updated date descending
-        jql += " ORDER BY updated DESC"
+        jql = self._build_jql(terms, tag_slugs)
 
-        cache_key = f"atlassian_jira_{hash(jql)}"
-        cached = cache.get(cache_key)
-        if cached:
-            cached["cached"] = True
-            return cached
+        # Never ask Jira for more rows than the tab is configured to render
+        max_results = min(max_results, self.jira_max_results)
+        cache_key = _cache_key("atlassian_jira", f"{max_results}:{jql}")
+        return self._get_or_fetch(
+            cache_key,
+            lambda: self._fetch_jira(jql, terms, terms_with_fields, max_results, tag_slugs),
+        )
+
+    def _fetch_jira(
+        self,
+        jql: str,
+        search_terms: list[str],
+        terms_with_fields: dict[str, str],
+        max_results: int,
+        tag_slugs: list[str],
+    ) -> dict:
+        """Run a Jira search and build the (uncached) response dict."""
+        search_mode = self.config.get("jira_search_mode", "strict")
+        jira_prefix = self.config.get("jira_tag_label_prefix", "")
 
         params = {
             "jql": jql,
             "maxResults": max_results,
-            "fields": "summary,status,issuetype,priority,assignee,created,updated,project,labels",
+            "fields": JIRA_SEARCH_FIELDS_WITH_LABELS if tag_slugs else JIRA_SEARCH_FIELDS,
         }
 
         result = self._jira_request("search", params)
@@ -301,49 +650,18 @@ class AtlassianClient:
         if result is None:
             return {"issues": [], "total": 0, "error": "Failed to connect to Jira"}
 
-        issues = []
-        for issue in result.get("issues", []):
-            fields = issue.get("fields", {})
-            summary = fields.get("summary", "")
-            key = issue.get("key", "")
-
-            # Find which search field names matched this issue (check summary and key)
-            matched_fields = self._find_matched_fields(search_terms, terms_with_fields, [summary, key])
-
-            # Check tag label matches
-            if tag_slugs:
-                issue_labels = fields.get("labels", [])
-                tag_matches = self._find_matched_tags(tag_slugs, issue_labels, jira_prefix)
-                matched_fields.extend(tag_matches)
-
-            # Filter based on search mode
-            if search_mode in ("title_only", "strict"):
-                # Only include results where we can verify the match in summary/key or labels
-                if not matched_fields:
-                    continue
-            # For "full_text" mode, include all results
+        # Only include results where we can verify the match in summary/key or labels,
+        # except in "full_text" mode which includes all results
+        require_match = search_mode in ("title_only", "strict")
 
-            issues.append(
-                {
-                    "key": key,
-                    "summary": summary,
-                    "status": fields.get("status", {}).get("name", ""),
-                    "status_category": fields.get("status", {}).get("statusCategory", {}).get("key", ""),
-                    "type": fields.get("issuetype", {}).get("name", ""),
-                    "type_icon": fields.get("issuetype", {}).get("iconUrl", ""),
-                    "priority": fields.get("priority", {}).get("name", "") if fields.get("priority") else "",
-                    "priority_icon": fields.get("priority", {}).get("iconUrl", "") if fields.get("priority") else "",
-                    "assignee": (
-                        fields.get("assignee", {}).get("displayName", "") if fields.get("assignee") else "Unassigned"
-                    ),
-                    "created": fields.get("created", ""),
-                    "updated": fields.get("updated", ""),
-                    "project": fields.get("project", {}).get("name", ""),
-                    "project_key": fields.get("project", {}).get("key", ""),
-                    "url": f"{self.jira_url}/browse/{key}",
-                    "matched_terms": matched_fields,
-                }
+        browse_url = f"{self.jira_url}/browse/"
+        issues = []
+        for issue in result.get("issues", ()):
+            parsed = self._build_jira_issue(
+                issue, search_terms, terms_with_fields, tag_slugs, jira_prefix, browse_url, require_match
             )
+            if parsed is not None:
+                issues.append(parsed)
 
         response = {
             "issues": issues,
@@ -352,9 +670,59 @@ class AtlassianClient:
             "cached": False,
         }
 
-        cache.set(cache_key, response, self.cache_timeout)
         return response
 
+    def _build_jira_issue(
+        self,
+        issue: dict,
+        search_terms: list[str],
+        terms_with_fields: dict[str, str],
+        tag_slugs: Optional[list[str]],
+        jira_prefix: str,
+        browse_url: str,
+        require_match: bool,
+    ) -> Optional[dict]:
+        """Convert a raw Jira issue into a result row, or None if filtered out by require_match."""
+        fields = issue.get("fields") or {}
+        summary = fields.get("summary", "")
+        key = issue.get("key", "")
+
+        # Find which search field names matched this issue (check summary and key)
+        matched_fields = self._find_matched_fields(search_terms, terms_with_fields, [summary, key])
+
+        # Check tag label matches
+        if tag_slugs:
+            issue_labels = fields.get("labels", [])
+            tag_matches = self._find_matched_tags(tag_slugs, issue_labels, jira_prefix)
+            matched_fields.extend(tag_matches)
+
+        if require_match and not matched_fields:
+            return None
+
+        status = fields.get("status") or {}
+        issuetype = fields.get("issuetype") or {}
+        priority = fields.get("priority") or {}
+        assignee = fields.get("assignee")
+        project = fields.get("project") or {}
+
+        return {
+            "key": key,
+            "summary": summary,
+            "status": status.get("name", ""),
+            "status_category": (status.get("statusCategory") or {}).get("key", ""),
+            "type": issuetype.get("name", ""),
+            "type_icon": issuetype.get("iconUrl", ""),
+            "priority": priority.get("name", ""),
+            "priority_icon": priority.get("iconUrl", ""),
+            "assignee": assignee.get("displayName", "") if assignee else "Unassigned",
+            "created": fields.get("created", ""),
+            "updated": fields.get("updated", ""),
+            "project": project.get("name", ""),
+            "project_key": project.get("key", ""),
+            "url": f"{browse_url}{key}",
+            "matched_terms": matched_fields,
+        }
+
     def search_confluence(
         self, search_terms: list[str], terms_with_fields: dict[str, str], max_results: int = 10, tag_slugs: list[str] = None
     ) -> dict:
@@ -369,57 +737,54 @@ class AtlassianClient:
         Returns:
             dict with 'pages' list and 'total' count
         """
-        if not self.confluence_url or (not search_terms and not tag_slugs):
+        # Drop empty and duplicate terms (e.g. hostname == asset tag), keeping order
+        terms = list(dict.fromkeys(t for t in search_terms if t))
+        if not self.confluence_url or (not terms and not tag_slugs):
             return {"pages": [], "total": 0, "error": None}
 
         # Get search mode from config
         search_mode = self.config.get("confluence_search_mode", "strict")
 
         # Build CQL query with OR logic
-        text_queries = []
-        for term in search_terms:
-            if term:
-                # Escape special CQL characters
-                escaped = term.replace('"', '\\"')
-                if search_mode == "title_only":
-                    # Only search in page titles
-                    text_queries.append(f'title ~ "{escaped}"')
-                else:
-                    # Search in all content (text includes title, body, comments)
-                    text_queries.append(f'text ~ "{escaped}"')
+        # title_only searches page titles, otherwise all content (title, body, comments)
+        text_field = "title" if search_mode == "title_only" else "text"
+        # Sorted so the same terms in any order share one cache entry
+        text_queries = [f'{text_field} ~ "{term.translate(QUERY_ESCAPE)}"' for term in sorted(terms)]
 
         # Build label query for tags
         label_queries = []
         confluence_prefix = self.config.get("confluence_tag_label_prefix", "")
         if tag_slugs:
-            prefixed = [f"{confluence_prefix}{s}" for s in tag_slugs]
+            prefixed = [f"{confluence_prefix}{s}" for s in sorted(tag_slugs)]
             label_list = ", ".join([f'"{lbl}"' for lbl in prefixed])
             label_queries.append(f"label in ({label_list})")
 
-        if not text_queries and not label_queries:
-            return {"pages": [], "total": 0, "error": None}
-
-        cql = " OR ".join(text_queries + label_queries)
-
-        # Filter to pages only (not attachments, comments, etc.)
-        cql = f"({cql}) AND type = page"
+        cql = f"({' OR '.join(text_queries + label_queries)}){self._confluence_cql_suffix}"
 
-        # Add space filter if configured
-        spaces = self.config.get("confluence_spaces", [])
-        if spaces:
-            space_cql = " OR ".join([f'space = "{s}"' for s in spaces])
-            cql = f"({cql}) AND ({space_cql})"
+        # Never ask Confluence for more rows than the tab is configured to render
+        max_results = min(max_results, self.confluence_max_results)
+        cache_key = _cache_key("atlassian_confluence", f"{max_results}:{cql}")
+        return self._get_or_fetch(
+            cache_key,
+            lambda: self._fetch_confluence(cql, terms, terms_with_fields, max_results, tag_slugs),
+        )
 
-        cache_key = f"atlassian_confluence_{hash(cql)}"
-        cached = cache.get(cache_key)
-        if cached:
-            cached["cached"] = True
-            return cached
+    def _fetch_confluence(
+        self,
+        cql: str,
+        search_terms: list[str],
+        terms_with_fields: dict[str, str],
+        max_results: int,
+        tag_slugs: list[str],
+    ) -> dict:
+        """Run a Confluence search and build the (uncached) response dict."""
+        search_mode = self.config.get("confluence_search_mode", "strict")
+        confluence_prefix = self.config.get("confluence_tag_label_prefix", "")
 
         params = {
             "cql": cql,
             "limit": max_results,
-            "expand": "space,version,ancestors,metadata.labels",
+            "expand": CONFLUENCE_SEARCH_EXPAND_WITH_LABELS if tag_slugs else CONFLUENCE_SEARCH_EXPAND,
         }
 
         result = self._confluence_request("content/search", params)
@@ -427,14 +792,15 @@ class AtlassianClient:
         if result is None:
             return {"pages": [], "total": 0, "error": "Failed to connect to Confluence"}
 
+        confluence_url = self.confluence_url
         pages = []
-        for page in result.get("results", []):
-            space = page.get("space", {})
-            version = page.get("version", {})
+        for page in result.get("results", ()):
+            space = page.get("space") or {}
+            version = page.get("version") or {}
             title = page.get("title", "")
 
             # Build breadcrumb from ancestors
-            ancestors = page.get("ancestors", [])
+            ancestors = page.get("ancestors", ())
             breadcrumb = " > ".join([a.get("title", "") for a in ancestors])
 
             # Find which search field names matched this page (check title and breadcrumb)
@@ -465,7 +831,7 @@ class AtlassianClient:
                     "last_modified": version.get("when", ""),
                     "last_modified_by": version.get("by", {}).get("displayName", ""),
                     "breadcrumb": breadcrumb,
-                    "url": f"{self.confluence_url}{page.get('_links', {}).get('webui', '')}",
+                    "url": f"{confluence_url}{(page.get('_links') or {}).get('webui', '')}",
                     "matched_terms": matched_fields,
                 }
             )
@@ -477,9 +843,90 @@ class AtlassianClient:
             "cached": False,
         }
 
-        cache.set(cache_key, response, self.cache_timeout)
         return response
 
+    def search_all(
+        self,
+        search_terms: list[str],
+        terms_with_fields: dict[str, str],
+        jira_max_results: int = 10,
+        confluence_max_results: int = 10,
+        tag_slugs: list[str] = None,
+    ) -> tuple[dict, dict]:
+        """
+        Search Jira and Confluence concurrently.
+
+        Each backend gets at most one request for all terms and tags: they
+        are OR-ed into a single JQL/CQL query (deduplicated and sorted for a
+        stable cache key), so callers pass plain term lists and never need to
+        pre-join queries. Both searches share this client's session, so pooled
+        keep-alive connections are reused across the two worker threads.
+
+        Returns:
+            tuple of (jira_results, confluence_results)
+        """
+        # One deadline for both sides, so two hung backends can't double the wait
+        deadline = time.monotonic() + self.search_deadline
+        jira_future = _search_executor.submit(
+            self.search_jira, search_terms, terms_with_fields, max_results=jira_max_results, tag_slugs=tag_slugs
+        )
+        confluence_future = _search_executor.submit(
+            self.search_confluence,
+            search_terms,
+            terms_with_fields,
+            max_results=confluence_max_results,
+            tag_slugs=tag_slugs,
+        )
+
+        return (
+            self._search_result(jira_future, "Jira", "issues", deadline),
+            self._search_result(confluence_future, "Confluence", "pages", deadline),
+        )
+
+    def _search_result(self, future, service: str, results_key: str, deadline: float) -> dict:
+        """
+        Wait for a search future until the monotonic deadline.
+
+        A timeout or crash becomes an error response for that side only.
+        """
+        try:
+            return future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            logger.error(f"{service} search timed out")
+            return {results_key: [], "total": 0, "error": f"{service} search timed out"}
+        except Exception as e:
+            logger.exception(f"{service} search failed: {e}")
+            return {results_key: [], "total": 0, "error": f"{service} search failed"}
+
+    def prefetch(
+        self,
+        search_terms: list[str],
+        terms_with_fields: dict[str, str],
+        jira_max_results: int = 10,
+        confluence_max_results: int = 10,
+        tag_slugs: list[str] = None,
+    ):
+        """
+        Start the Jira and Confluence searches in the background without waiting.
+
+        Results land in the cache, so a following search_all() with the same
+        arguments is served from cache or waits on the in-flight request.
+        Prefetches run on their own bounded pool and are skipped when it is
+        busy, so they never delay search_all().
+        """
+        submitted = _submit_prefetch(
+            self.search_jira, search_terms, terms_with_fields, max_results=jira_max_results, tag_slugs=tag_slugs
+        )
+        submitted &= _submit_prefetch(
+            self.search_confluence,
+            search_terms,
+            terms_with_fields,
+            max_results=confluence_max_results,
+            tag_slugs=tag_slugs,
+        )
+        if not submitted:
+            logger.debug("Prefetch pool busy, skipped background Atlassian search")
+
     def _convert_wiki_to_storage(self, session, wiki_body: str) -> str | None:
         """Convert wiki markup to Confluence storage format via the REST API."""
         url = f"{self.confluence_url}/rest/api/contentbody/convert/storage"
@@ -515,6 +962,10 @@ class AtlassianClient:
             re.DOTALL,
         )
         _CB_DETECT = re.compile(rf"<li>\s*(?:\[ \]|{re.escape(_DONE_PLACEHOLDER)})")
+        _NON_CB_PATTERN = re.compile(
+            rf"<li>(?!\s*(?:\[ \]|{re.escape(_DONE_PLACEHOLDER)}))(.*?)</li>",
+            re.DOTALL,
+        )
 
         task_id_counter = [1]
 
@@ -543,11 +994,7 @@ class AtlassianClient:
                 )
 
             # Also keep any non-checkbox <li> items as regular list items
-            non_checkbox_items = re.findall(
-                rf"<li>(?!\s*(?:\[ \]|{re.escape(_DONE_PLACEHOLDER)}))(.*?)</li>",
-                ul_content,
-                re.DOTALL,
-            )
+            non_checkbox_items = _NON_CB_PATTERN.findall(ul_content)
 
             result = ""
             if tasks:
@@ -651,7 +1098,8 @@ class AtlassianClient:
         if not self.jira_token and not self.jira_username:
             return False, "Jira credentials not configured (need token or username/password)"
 
-        result = self._jira_request("myself")
+        self._get_session()
+        result = self._send_probe(self._prepared_myself, self.jira_verify_ssl, "Jira")
         if result:
             return True, f"Connected as {result.get('displayName', result.get('name', 'Unknown'))}"
         return False, "Failed to connect to Jira"
@@ -664,12 +1112,34 @@ class AtlassianClient:
         if not self.confluence_token and not self.confluence_username:
             return False, "Confluence credentials not configured (need token or username/password)"
 
-        result = self._confluence_request("user/current")
+        self._get_session()
+        result = self._send_probe(self._prepared_user_current, self.confluence_verify_ssl, "Confluence")
         if result:
             return True, f"Connected as {result.get('displayName', result.get('username', 'Unknown'))}"
         return False, "Failed to connect to Confluence"
 
 
 def get_client() -> AtlassianClient:
-    """Get a configured Atlassian client instance."""
-    return AtlassianClient()
+    """
+    Get the shared Atlassian client instance.
+
+    The client (and its session's keep-alive connection pool) is created once
+    per process and reused across requests.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = AtlassianClient()
+                client._get_session()
+                _client = client
+    return _client
+
+
+@receiver(setting_changed)
+def _reset_client(setting, **kwargs):
+    """Drop the shared client when plugin settings change (e.g. override_settings)."""
+    global _client
+    if setting == "PLUGINS_CONFIG":
+        with _client_lock:
+            _client = None
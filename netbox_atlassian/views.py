@@ -7,22 +7,37 @@ Provides Document Library for generating documents from NetBox device data.
 """
 
 import datetime
+import functools
+import hashlib
+import operator
 import re
+import time
+from types import MappingProxyType, SimpleNamespace
+from typing import Optional
 
 from dcim.models import Device
 from tenancy.models import Contact, ContactGroup
+from django.apps import apps
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.http import HttpResponse, JsonResponse
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template import Context, Template
-from django.template.loader import render_to_string
+from django.template.loader import get_template
+from django.template.response import TemplateResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from django.views import View
 from netbox.views import generic
 from utilities.views import ViewTab, register_model_view
 from virtualization.models import VirtualMachine
 
+from . import DEFAULT_ENDPOINT_SEARCH_FIELDS
 from .atlassian_client import get_client
 from .forms import AtlassianSettingsForm, DocumentGenerateForm, DocumentTemplateForm
 from .models import DocumentTemplate
@@ -35,6 +50,52 @@ try:
 except ImportError:
     ENDPOINTS_PLUGIN_INSTALLED = False
 
+# Seconds a browser may reuse rendered tab content before revalidating with its ETag
+CONTENT_MAX_AGE = 60
+
+# Search fields shown on the VM tab (VMs are always searched by name and primary IPv4)
+VM_SEARCH_FIELDS = (MappingProxyType({"name": "Name", "attribute": "name", "enabled": True}),)
+VM_SEARCH_FIELDS_WITH_IP = VM_SEARCH_FIELDS + (
+    MappingProxyType({"name": "Primary IP", "attribute": "primary_ip4", "enabled": True}),
+)
+
+# Seconds the skeleton view's search inputs are kept for the htmx content request
+SEARCH_INPUTS_TIMEOUT = 60
+
+
+@functools.lru_cache(maxsize=1)
+def get_tab_config() -> SimpleNamespace:
+    """
+    Get a snapshot of the plugin settings used when rendering Atlassian tabs.
+
+    PLUGINS_CONFIG is fixed for the life of the process, so this is built once
+    and reset only when settings change (e.g. under override_settings).
+    """
+    config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
+    endpoint_search_fields = config.get("endpoint_search_fields", DEFAULT_ENDPOINT_SEARCH_FIELDS)
+    return SimpleNamespace(
+        enabled_fields=apps.get_app_config("netbox_atlassian").enabled_search_fields,
+        enabled_endpoint_fields=tuple(f for f in endpoint_search_fields if f.get("enabled", True)),
+        device_types=tuple(config.get("device_types", [])),
+        search_by_tags=config.get("search_by_tags", True),
+        tag_search_exclude=frozenset(config.get("tag_search_exclude", [])),
+        jira_max=config.get("jira_max_results", 10),
+        confluence_max=config.get("confluence_max_results", 10),
+        cache_timeout=config.get("cache_timeout", 300),
+        jira_url=config.get("jira_url", "").rstrip("/"),
+        confluence_url=config.get("confluence_url", "").rstrip("/"),
+    )
+
+
+@receiver(setting_changed)
+def _reset_tab_config(setting, **kwargs):
+    """Drop cached settings snapshots, compiled search fields and templates when settings change."""
+    if setting == "PLUGINS_CONFIG":
+        get_tab_config.cache_clear()
+        apps.get_app_config("netbox_atlassian")._compile_search_fields()
+    elif setting == "TEMPLATES":
+        _load_template.cache_clear()
+
 
 def get_device_attribute(device, attribute_path: str):
     """
@@ -47,18 +108,134 @@ def get_device_attribute(device, attribute_path: str):
     Returns:
         Attribute value or None if not found
     """
+    return _resolve_attribute(device, _attribute_getter(attribute_path))
+
+
+@functools.lru_cache(maxsize=None)
+def _attribute_getter(attribute_path: str):
+    """Get a cached operator.attrgetter for a dot-separated attribute path."""
+    return operator.attrgetter(attribute_path)
+
+
+def _resolve_attribute(obj, getter):
+    """
+    Resolve an attribute getter against an object.
+
+    Missing attributes and None anywhere in the path give None,
+    IP addresses are returned without the prefix length.
+    """
     try:
-        value = device
-        for part in attribute_path.split("."):
-            value = getattr(value, part, None)
-            if value is None:
-                return None
-        # Convert to string for IP addresses
-        if hasattr(value, "ip"):
-            return str(value.ip)
-        return str(value) if value else None
+        value = getter(obj)
     except Exception:
+        # Intermediate None or missing attribute/related object
         return None
+    if value is None:
+        return None
+    # Convert to string for IP addresses
+    if hasattr(value, "ip"):
+        return str(value.ip)
+    return str(value) if value else None
+
+
+@functools.lru_cache(maxsize=None)
+def _select_related_lookups(model, attribute_paths: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Get the select_related() lookups needed to resolve dotted attribute paths on a model.
+
+    Only forward foreign key / one-to-one hops are followed; a path stops at the
+    first non-relational part (e.g. custom_field_data.cmdb_id needs no join).
+    """
+    lookups = set()
+    for path in attribute_paths:
+        current = model
+        parts = []
+        for part in path.split(".")[:-1]:
+            try:
+                field = current._meta.get_field(part)
+            except FieldDoesNotExist:
+                break
+            if not (field.many_to_one or field.one_to_one) or field.related_model is None:
+                break
+            parts.append(part)
+            current = field.related_model
+        if parts:
+            lookups.add("__".join(parts))
+    return tuple(sorted(lookups))
+
+
+def get_device_queryset():
+    """Device queryset joining the relations used by the configured search fields."""
+    compiled_fields = apps.get_app_config("netbox_atlassian").compiled_search_fields
+    paths = tuple(attribute for _name, attribute, _getter in compiled_fields)
+    return Device.objects.select_related(*_select_related_lookups(Device, paths))
+
+
+@functools.lru_cache(maxsize=None)
+def _only_fields(model, attribute_paths: tuple[str, ...]) -> Optional[tuple[str, ...]]:
+    """
+    Get the only() field names needed to resolve dotted attribute paths on a model.
+
+    Returns None if any path starts with something other than a model field
+    (e.g. a property), since deferring columns could then cost extra queries.
+    """
+    fields = set()
+    for path in attribute_paths:
+        current = model
+        parts = []
+        for part in path.split("."):
+            try:
+                field = current._meta.get_field(part)
+            except FieldDoesNotExist:
+                if not parts:
+                    return None
+                break
+            if not field.concrete:
+                return None
+            parts.append(part)
+            fields.add("__".join(parts))
+            if not (field.many_to_one or field.one_to_one) or field.related_model is None:
+                break
+            current = field.related_model
+    return tuple(sorted(fields))
+
+
+def get_device_content_queryset():
+    """
+    Device queryset for the tab content view.
+
+    Loads only the columns the configured search fields (and the ETag) read;
+    the content template does not render any other device attributes.
+    """
+    compiled_fields = apps.get_app_config("netbox_atlassian").compiled_search_fields
+    paths = tuple(attribute for _name, attribute, _getter in compiled_fields)
+    queryset = get_device_queryset()
+    fields = _only_fields(Device, paths)
+    if fields is None:
+        return queryset
+    return queryset.only("last_updated", *fields)
+
+
+def get_vm_queryset():
+    """VirtualMachine queryset joining the primary IP used as a search term."""
+    return VirtualMachine.objects.select_related("primary_ip4")
+
+
+def get_vm_content_queryset():
+    """VirtualMachine queryset for the tab content view, narrowed to the searched columns."""
+    return get_vm_queryset().only("last_updated", "name", "primary_ip4", "primary_ip4__address")
+
+
+def _add_search_terms(terms: dict[str, str], value: str, field_name: str):
+    """
+    Add a field value to a term -> field_name dict.
+
+    Comma-separated values (e.g., multiple serial numbers) are split into
+    individual terms. A term keeps the first field it was found in.
+    """
+    for part in value.split(","):
+        part = part.strip()
+        if part:
+            terms.setdefault(part, field_name)
 
 
 def get_search_terms(device) -> list[str]:
@@ -79,30 +256,13 @@ def get_search_terms_with_fields(device) -> dict[str, str]:
     Returns dict mapping term -> field_name (e.g., {"server01": "Hostname", "ABC123": "Serial"})
     For comma-separated values, each part maps to the same field name.
     """
-    config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
-    search_fields = config.get("search_fields", [])
+    compiled_fields = apps.get_app_config("netbox_atlassian").compiled_search_fields
 
     terms = {}  # term -> field_name
-    for field in search_fields:
-        if not field.get("enabled", True):
-            continue
-
-        attribute = field.get("attribute", "")
-        field_name = field.get("name", attribute)
-        if not attribute:
-            continue
-
-        value = get_device_attribute(device, attribute)
-        if value and value.strip():
-            # Split comma-separated values (e.g., multiple serial numbers)
-            if "," in value:
-                for part in value.split(","):
-                    part = part.strip()
-                    if part and part not in terms:
-                        terms[part] = field_name
-            else:
-                if value.strip() not in terms:
-                    terms[value.strip()] = field_name
+    for field_name, _attribute, getter in compiled_fields:
+        value = _resolve_attribute(device, getter)
+        if value:
+            _add_search_terms(terms, value, field_name)
 
     return terms
 
@@ -113,11 +273,11 @@ def get_tag_slugs(obj) -> list[str]:
 
     Excludes generic tags (environment, role) configured in tag_search_exclude.
     """
-    config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
-    if not config.get("search_by_tags", True):
+    config = get_tab_config()
+    if not config.search_by_tags:
         return []
 
-    exclude = set(config.get("tag_search_exclude", []))
+    exclude = config.tag_search_exclude
 
     try:
         return [tag.slug for tag in obj.tags.all() if tag.slug not in exclude]
@@ -125,6 +285,69 @@ def get_tag_slugs(obj) -> list[str]:
         return []
 
 
+def get_vm_search_terms_with_fields(vm) -> dict[str, str]:
+    """
+    Get search terms from a virtual machine with their source field names.
+
+    VMs are searched by name and primary IPv4 address.
+    """
+    terms_with_fields = {}
+    if vm.name:
+        terms_with_fields[vm.name] = "Name"
+    if vm.primary_ip4:
+        terms_with_fields[str(vm.primary_ip4.address.ip)] = "Primary IP"
+    return terms_with_fields
+
+
+def _search_inputs_cache_key(obj) -> str:
+    """Cache key for an object's search terms and tag slugs, tied to its last change."""
+    last_updated = getattr(obj, "last_updated", None)
+    version = last_updated.timestamp() if last_updated else ""
+    return f"atlassian_inputs_{obj._meta.label_lower}_{obj.pk}_{version}"
+
+
+def prefetch_atlassian_content(obj, terms_with_fields: dict[str, str]):
+    """
+    Start the Jira/Confluence searches for an object's tab in the background.
+
+    Called from the tab skeleton views so the searches are already running (and
+    their results cached) by the time the htmx content request arrives. The
+    search inputs are cached too, so the content view does not rebuild them.
+    """
+    tag_slugs = get_tag_slugs(obj)
+    cache.set(_search_inputs_cache_key(obj), (terms_with_fields, tag_slugs), SEARCH_INPUTS_TIMEOUT)
+    if not terms_with_fields and not tag_slugs:
+        return
+
+    config = get_tab_config()
+    get_client().prefetch(
+        list(terms_with_fields.keys()),
+        terms_with_fields,
+        jira_max_results=config.jira_max,
+        confluence_max_results=config.confluence_max,
+        tag_slugs=tag_slugs,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_device_type_patterns(patterns: tuple[str, ...]) -> tuple[tuple, tuple[str, ...]]:
+    """
+    Compile the configured device_types patterns once.
+
+    Returns (compiled regexes, literal patterns), both lowercased. Patterns
+    that are not valid regexes are matched as plain substrings instead.
+    """
+    regexes = []
+    literals = []
+    for pattern in patterns:
+        pattern = pattern.lower()
+        try:
+            regexes.append(re.compile(pattern))
+        except re.error:
+            literals.append(pattern)
+    return tuple(regexes), tuple(literals)
+
+
 def should_show_atlassian_tab(device) -> bool:
     """
     Determine if the Atlassian tab should be visible for this device.
@@ -133,31 +356,29 @@ def should_show_atlassian_tab(device) -> bool:
     - Device has at least one searchable field value
     - Device type matches configured filters (if any)
     """
-    config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
-    device_types = config.get("device_types", [])
-
-    # Check device type filter if configured
-    if device_types and device.device_type:
-        manufacturer_slug = device.device_type.manufacturer.slug.lower() if device.device_type.manufacturer else ""
-        manufacturer_name = device.device_type.manufacturer.name.lower() if device.device_type.manufacturer else ""
+    device_types = get_tab_config().device_types
+
+    # Check device type filter if configured (any() stops at the first matching pattern).
+    # The _id columns are checked first so a missing device type or manufacturer
+    # never costs a query just to find out it is not there.
+    if device_types and device.device_type_id is not None:
+        device_type = device.device_type
+        if device_type.manufacturer_id is not None:
+            manufacturer = device_type.manufacturer
+            manufacturer_slug = manufacturer.slug.lower()
+            manufacturer_name = manufacturer.name.lower()
+        else:
+            manufacturer_slug = manufacturer_name = ""
 
-        matches = False
-        for pattern in device_types:
-            try:
-                if re.search(pattern.lower(), manufacturer_slug) or re.search(pattern.lower(), manufacturer_name):
-                    matches = True
-                    break
-            except re.error:
-                if pattern.lower() in manufacturer_slug or pattern.lower() in manufacturer_name:
-                    matches = True
-                    break
-
-        if not matches:
+        regexes, literals = _compiled_device_type_patterns(device_types)
+        if not (
+            any(regex.search(manufacturer_slug) or regex.search(manufacturer_name) for regex in regexes)
+            or any(literal in manufacturer_slug or literal in manufacturer_name for literal in literals)
+        ):
             return False
 
     # Check if we have any search terms
-    terms = get_search_terms(device)
-    return len(terms) > 0
+    return bool(get_search_terms(device))
 
 
 @register_model_view(Device, name="atlassian", path="atlassian")
@@ -176,7 +397,8 @@ class DeviceAtlassianView(generic.ObjectView):
 
     def get(self, request, pk):
         """Render initial tab with loading spinner - content loads via htmx."""
-        device = Device.objects.get(pk=pk)
+        device = get_object_or_404(get_device_queryset(), pk=pk)
+        prefetch_atlassian_content(device, get_search_terms_with_fields(device))
         return render(
             request,
             self.template_name,
@@ -188,63 +410,150 @@ class DeviceAtlassianView(generic.ObjectView):
         )
 
 
-class DeviceAtlassianContentView(LoginRequiredMixin, PermissionRequiredMixin, View):
-    """HTMX endpoint that returns Atlassian content for async loading."""
+@functools.lru_cache(maxsize=None)
+def _load_template(template_name: str):
+    """Load and compile a template once per process."""
+    return get_template(template_name)
 
-    permission_required = "dcim.view_device"
+
+def get_tab_template(template_name: str):
+    """
+    Get a compiled tab template, skipping the loader lookup after the first use.
+
+    In DEBUG the template is looked up every time so edits show up without a restart.
+    """
+    if settings.DEBUG:
+        return get_template(template_name)
+    return _load_template(template_name)
+
+
+def _content_etag(obj, search_terms, tag_slugs, config) -> str:
+    """
+    Build an ETag for rendered tab content.
+
+    Covers the object (and its last change), the search inputs, and the
+    server-side result cache window, so the tag changes whenever the
+    rendered Jira/Confluence results could.
+    """
+    last_updated = getattr(obj, "last_updated", None)
+    window = int(time.time() // max(int(config.cache_timeout or 0), 1))
+    key = "|".join(
+        (
+            obj._meta.label_lower,
+            str(obj.pk),
+            last_updated.isoformat() if last_updated else "",
+            "\x1f".join(search_terms),
+            "\x1f".join(tag_slugs),
+            str(window),
+        )
+    )
+    return quote_etag(hashlib.blake2b(key.encode(), digest_size=12).hexdigest())
+
+
+class BaseAtlassianContentView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    Base HTMX endpoint that returns Atlassian content for async loading.
+
+    Subclasses set permission_required and provide the object queryset,
+    search terms and displayed search fields for their model.
+    """
+
+    template_name = "netbox_atlassian/tab_content.html"
+    # Whether the model's skeleton view caches search inputs via prefetch_atlassian_content()
+    prefetched = False
+
+    def get_queryset(self):
+        """Return the queryset the tab object is loaded from."""
+        raise NotImplementedError
+
+    def get_search_terms_with_fields(self, obj) -> dict[str, str]:
+        """Return search terms for obj mapped to their source field names."""
+        raise NotImplementedError
+
+    def get_enabled_fields(self, obj, config) -> tuple:
+        """Return the search fields shown in the tab for obj."""
+        return config.enabled_fields
 
     def get(self, request, pk):
         """Fetch Atlassian data and return HTML content."""
-        device = Device.objects.get(pk=pk)
+        obj = get_object_or_404(self.get_queryset(), pk=pk)
 
-        config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
+        config = get_tab_config()
         client = get_client()
 
-        # Get search terms with their source field names
-        terms_with_fields = get_search_terms_with_fields(device)
+        # Reuse the search terms and tag slugs the skeleton view just computed
+        search_inputs = cache.get(_search_inputs_cache_key(obj)) if self.prefetched else None
+        if search_inputs is not None:
+            terms_with_fields, tag_slugs = search_inputs
+        else:
+            # Get search terms with their source field names
+            terms_with_fields = self.get_search_terms_with_fields(obj)
+            # Get tag slugs for label-based search
+            tag_slugs = get_tag_slugs(obj)
         search_terms = list(terms_with_fields.keys())
 
-        # Get tag slugs for label-based search
-        tag_slugs = get_tag_slugs(device)
-
-        # Get configured search fields for display
-        search_fields = config.get("search_fields", [])
-        enabled_fields = [f for f in search_fields if f.get("enabled", True)]
+        # Let the browser reuse content it already has (304) without searching again
+        etag = _content_etag(obj, search_terms, tag_slugs, config)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
 
         # Search Jira and Confluence
         jira_results = {"issues": [], "total": 0, "error": None}
         confluence_results = {"pages": [], "total": 0, "error": None}
 
         if search_terms or tag_slugs:
-            jira_max = config.get("jira_max_results", 10)
-            confluence_max = config.get("confluence_max_results", 10)
-
-            jira_results = client.search_jira(search_terms, terms_with_fields, max_results=jira_max, tag_slugs=tag_slugs)
-            confluence_results = client.search_confluence(search_terms, terms_with_fields, max_results=confluence_max, tag_slugs=tag_slugs)
+            jira_results, confluence_results = client.search_all(
+                search_terms,
+                terms_with_fields,
+                jira_max_results=config.jira_max,
+                confluence_max_results=config.confluence_max,
+                tag_slugs=tag_slugs,
+            )
 
         # Get URLs for external links
-        jira_url = config.get("jira_url", "").rstrip("/")
-        confluence_url = config.get("confluence_url", "").rstrip("/")
-
-        return HttpResponse(
-            render_to_string(
-                "netbox_atlassian/tab_content.html",
-                {
-                    "object": device,
-                    "search_terms": search_terms,
-                    "tag_slugs": tag_slugs,
-                    "enabled_fields": enabled_fields,
-                    "jira_results": jira_results,
-                    "confluence_results": confluence_results,
-                    "jira_url": jira_url,
-                    "confluence_url": confluence_url,
-                    "jira_configured": bool(jira_url),
-                    "confluence_configured": bool(confluence_url),
-                },
-                request=request,
-            )
+        jira_url = config.jira_url
+        confluence_url = config.confluence_url
+
+        # Rendering is deferred until the response is returned to the handler
+        response = TemplateResponse(
+            request,
+            get_tab_template(self.template_name),
+            {
+                "object": obj,
+                "search_terms": search_terms,
+                "tag_slugs": tag_slugs,
+                "enabled_fields": self.get_enabled_fields(obj, config),
+                "jira_results": jira_results,
+                "confluence_results": confluence_results,
+                "jira_url": jira_url,
+                "confluence_url": confluence_url,
+                "jira_configured": bool(jira_url),
+                "confluence_configured": bool(confluence_url),
+            },
         )
 
+        # Only let clients reuse complete results; errors should be retried
+        if jira_results.get("error") or confluence_results.get("error"):
+            patch_cache_control(response, no_cache=True, private=True)
+        else:
+            response["ETag"] = etag
+            patch_cache_control(response, private=True, max_age=CONTENT_MAX_AGE)
+        return response
+
+
+class DeviceAtlassianContentView(BaseAtlassianContentView):
+    """HTMX endpoint that returns Atlassian content for async loading."""
+
+    permission_required = "dcim.view_device"
+    prefetched = True
+
+    def get_queryset(self):
+        return get_device_content_queryset()
+
+    def get_search_terms_with_fields(self, obj) -> dict[str, str]:
+        return get_search_terms_with_fields(obj)
+
 
 @register_model_view(VirtualMachine, name="atlassian", path="atlassian")
 class VirtualMachineAtlassianView(generic.ObjectView):
@@ -262,7 +571,8 @@ class VirtualMachineAtlassianView(generic.ObjectView):
 
     def get(self, request, pk):
         """Render initial tab with loading spinner - content loads via htmx."""
-        vm = VirtualMachine.objects.get(pk=pk)
+        vm = get_object_or_404(get_vm_queryset(), pk=pk)
+        prefetch_atlassian_content(vm, get_vm_search_terms_with_fields(vm))
         return render(
             request,
             self.template_name,
@@ -274,68 +584,21 @@ class VirtualMachineAtlassianView(generic.ObjectView):
         )
 
 
-class VMAtlassianContentView(LoginRequiredMixin, PermissionRequiredMixin, View):
+class VMAtlassianContentView(BaseAtlassianContentView):
     """HTMX endpoint that returns Atlassian content for VM async loading."""
 
     permission_required = "virtualization.view_virtualmachine"
+    prefetched = True
 
-    def get(self, request, pk):
-        """Fetch Atlassian data and return HTML content."""
-        vm = VirtualMachine.objects.get(pk=pk)
-
-        config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
-        client = get_client()
+    def get_queryset(self):
+        return get_vm_content_queryset()
 
+    def get_search_terms_with_fields(self, obj) -> dict[str, str]:
         # For VMs, search by name and primary IP with field mapping
-        terms_with_fields = {}
-        if vm.name:
-            terms_with_fields[vm.name] = "Name"
-        if vm.primary_ip4:
-            terms_with_fields[str(vm.primary_ip4.address.ip)] = "Primary IP"
-
-        search_terms = list(terms_with_fields.keys())
-
-        # Get tag slugs for label-based search
-        tag_slugs = get_tag_slugs(vm)
-
-        # Get configured search fields for display
-        enabled_fields = [{"name": "Name", "attribute": "name", "enabled": True}]
-        if vm.primary_ip4:
-            enabled_fields.append({"name": "Primary IP", "attribute": "primary_ip4", "enabled": True})
-
-        # Search Jira and Confluence
-        jira_results = {"issues": [], "total": 0, "error": None}
-        confluence_results = {"pages": [], "total": 0, "error": None}
-
-        if search_terms or tag_slugs:
-            jira_max = config.get("jira_max_results", 10)
-            confluence_max = config.get("confluence_max_results", 10)
+        return get_vm_search_terms_with_fields(obj)
 
-            jira_results = client.search_jira(search_terms, terms_with_fields, max_results=jira_max, tag_slugs=tag_slugs)
-            confluence_results = client.search_confluence(search_terms, terms_with_fields, max_results=confluence_max, tag_slugs=tag_slugs)
-
-        # Get URLs for external links
-        jira_url = config.get("jira_url", "").rstrip("/")
-        confluence_url = config.get("confluence_url", "").rstrip("/")
-
-        return HttpResponse(
-            render_to_string(
-                "netbox_atlassian/tab_content.html",
-                {
-                    "object": vm,
-                    "search_terms": search_terms,
-                    "tag_slugs": tag_slugs,
-                    "enabled_fields": enabled_fields,
-                    "jira_results": jira_results,
-                    "confluence_results": confluence_results,
-                    "jira_url": jira_url,
-                    "confluence_url": confluence_url,
-                    "jira_configured": bool(jira_url),
-                    "confluence_configured": bool(confluence_url),
-                },
-                request=request,
-            )
-        )
+    def get_enabled_fields(self, obj, config) -> tuple:
+        return VM_SEARCH_FIELDS_WITH_IP if obj.primary_ip4 else VM_SEARCH_FIELDS
 
 
 class AtlassianSettingsView(LoginRequiredMixin, PermissionRequiredMixin, View):
@@ -423,18 +686,7 @@ def get_endpoint_attribute(endpoint, attribute_path: str):
     Returns:
         Attribute value or None if not found
     """
-    try:
-        value = endpoint
-        for part in attribute_path.split("."):
-            value = getattr(value, part, None)
-            if value is None:
-                return None
-        # Convert to string for IP addresses and MAC
-        if hasattr(value, "ip"):
-            return str(value.ip)
-        return str(value) if value else None
-    except Exception:
-        return None
+    return _resolve_attribute(endpoint, _attribute_getter(attribute_path))
 
 
 def get_endpoint_search_terms(endpoint) -> list[str]:
@@ -453,37 +705,16 @@ def get_endpoint_search_terms_with_fields(endpoint) -> dict[str, str]:
 
     Returns dict mapping term -> field_name.
     """
-    config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
-    search_fields = config.get(
-        "endpoint_search_fields",
-        [
-            {"name": "Name", "attribute": "name", "enabled": True},
-            {"name": "MAC Address", "attribute": "mac_address", "enabled": True},
-            {"name": "Serial", "attribute": "serial", "enabled": True},
-        ],
-    )
-
     terms = {}  # term -> field_name
-    for field in search_fields:
-        if not field.get("enabled", True):
-            continue
-
+    for field in get_tab_config().enabled_endpoint_fields:
         attribute = field.get("attribute", "")
         field_name = field.get("name", attribute)
         if not attribute:
             continue
 
         value = get_endpoint_attribute(endpoint, attribute)
-        if value and value.strip():
-            # Split comma-separated values
-            if "," in value:
-                for part in value.split(","):
-                    part = part.strip()
-                    if part and part not in terms:
-                        terms[part] = field_name
-            else:
-                if value.strip() not in terms:
-                    terms[value.strip()] = field_name
+        if value:
+            _add_search_terms(terms, value, field_name)
 
     return terms
 
@@ -504,71 +735,19 @@ def should_show_atlassian_tab_endpoint(endpoint) -> bool:
 # Endpoint views - only available if netbox_endpoints is installed
 if ENDPOINTS_PLUGIN_INSTALLED:
 
-    class EndpointAtlassianContentView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    class EndpointAtlassianContentView(BaseAtlassianContentView):
         """HTMX endpoint that returns Atlassian content for Endpoint async loading."""
 
         permission_required = "netbox_endpoints.view_endpoint"
 
-        def get(self, request, pk):
-            """Fetch Atlassian data and return HTML content."""
-            endpoint = Endpoint.objects.get(pk=pk)
-
-            config = settings.PLUGINS_CONFIG.get("netbox_atlassian", {})
-            client = get_client()
+        def get_queryset(self):
+            return Endpoint.objects.all()
 
-            # Get search terms with their source field names
-            terms_with_fields = get_endpoint_search_terms_with_fields(endpoint)
-            search_terms = list(terms_with_fields.keys())
-
-            # Get tag slugs for label-based search
-            tag_slugs = get_tag_slugs(endpoint)
-
-            # Get configured search fields for display
-            search_fields = config.get(
-                "endpoint_search_fields",
-                [
-                    {"name": "Name", "attribute": "name", "enabled": True},
-                    {"name": "MAC Address", "attribute": "mac_address", "enabled": True},
-                    {"name": "Serial", "attribute": "serial", "enabled": True},
-                ],
-            )
-            enabled_fields = [f for f in search_fields if f.get("enabled", True)]
-
-            # Search Jira and Confluence
-            jira_results = {"issues": [], "total": 0, "error": None}
-            confluence_results = {"pages": [], "total": 0, "error": None}
+        def get_search_terms_with_fields(self, obj) -> dict[str, str]:
+            return get_endpoint_search_terms_with_fields(obj)
 
-            if search_terms or tag_slugs:
-                jira_max = config.get("jira_max_results", 10)
-                confluence_max = config.get("confluence_max_results", 10)
-
-                jira_results = client.search_jira(search_terms, terms_with_fields, max_results=jira_max, tag_slugs=tag_slugs)
-                confluence_results = client.search_confluence(
-                    search_terms, terms_with_fields, max_results=confluence_max, tag_slugs=tag_slugs
-                )
-
-            # Get URLs for external links
-            jira_url = config.get("jira_url", "").rstrip("/")
-            confluence_url = config.get("confluence_url", "").rstrip("/")
-
-            return HttpResponse(
-                render_to_string(
-                    "netbox_atlassian/tab_content.html",
-                    {
-                        "object": endpoint,
-                        "search_terms": search_terms,
-                        "tag_slugs": tag_slugs,
-                        "enabled_fields": enabled_fields,
-                        "jira_results": jira_results,
-                        "confluence_results": confluence_results,
-                        "jira_url": jira_url,
-                        "confluence_url": confluence_url,
-                        "jira_configured": bool(jira_url),
-                        "confluence_configured": bool(confluence_url),
-                    },
-                    request=request,
-                )
-            )
+        def get_enabled_fields(self, obj, config) -> tuple:
+            return config.enabled_endpoint_fields
 
 
 # ---------------------------------------------------------------------------